@@ -100,9 +100,9 @@ interface MenuItem {
   text: string;
 }
 
-const PortfolioMenu: React.FC<MainMenuProps> = ({ handleOptionClicked }) => {
-  const menuItems: MenuItem[] = [{ text: 'people' }, { text: 'places' }, { text: 'nature' }];
+const menuItems: MenuItem[] = [{ text: 'people' }, { text: 'places' }, { text: 'nature' }];
 
+const PortfolioMenu: React.FC<MainMenuProps> = ({ handleOptionClicked }) => {
   return (
     // <div className='flex flex-row justify-evenly max-w-lg sm:max-w-xl md:max-w-2xl mx-auto mb-2 z-20'>
     <>
@@ -3,7 +3,7 @@ import { twMerge } from 'tailwind-merge';
 import Title from './Title';
 import PortfolioMenu from '../components/PortfolioMenu';
 import MainMenu from '../components/MainMenu';
-import { fadeConfig } from '../styles/animations/animations';
+import { fadeTransition } from '../styles/animations/animations';
 import { animated, useTransition } from 'react-spring';
 
 interface HeaderProps {
@@ -40,19 +40,9 @@ const Header: React.FC<HeaderProps> = (props) => {
     console.log(page);
   };
 
-  const mainMenuTransition = useTransition(showMainMenu, {
-    from: { opacity: 0 },
-    enter: { opacity: 1 },
-    leave: { opacity: 0 },
-    config: fadeConfig,
-  });
+  const mainMenuTransition = useTransition(showMainMenu, fadeTransition);
 
-  const secondaryMenuTransition = useTransition(showSecondaryMenu, {
-    from: { opacity: 0 },
-    enter: { opacity: 1 },
-    leave: { opacity: 0 },
-    config: fadeConfig,
-  });
+  const secondaryMenuTransition = useTransition(showSecondaryMenu, fadeTransition);
 
   return (
     <div className={twMerge('justify-center flex', className)}>
@@ -1,6 +1,7 @@
 import React, { useEffect, useRef, useState } from 'react';
 import { twMerge } from 'tailwind-merge';
 import { useSpring, animated, useSpringRef, useChain } from 'react-spring';
+import { initFadeConfig, titleScaleConfig } from '../styles/animations/animations';
 
 const Title: React.FC<{ className?: string }> = ({ className }) => {
   const [middleTranslateY, setMiddleTranslateY] = useState(0);
@@ -27,13 +28,7 @@ const Title: React.FC<{ className?: string }> = ({ className }) => {
     ref: fadeInRef,
     from: { opacity: 0 },
     to: { opacity: 0.9 },
-    config: {
-      mass: 20,
-      tension: 15,
-      friction: 1,
-      clamp: true,
-      precision: 0.001,
-    },
+    config: initFadeConfig,
     delay: 1000,
   });
   const scaleTranslRef = useSpringRef();
@@ -41,13 +36,7 @@ const Title: React.FC<{ className?: string }> = ({ className }) => {
     ref: scaleTranslRef,
     from: { opacity: 0.9, scale: initialScale, y: middleTranslateY },
     to: { opacity: 1, scale: 1, y: 0 },
-    config: {
-      mass: 6.5,
-      tension: 200,
-      friction: 140,
-      clamp: true,
-      precision: 0.001,
-    },
+    config: titleScaleConfig,
     delay: 1000,
   });
 
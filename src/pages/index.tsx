@@ -1,5 +1,4 @@
 import Layout from '../global-components/Layout';
-import Heading from '../global-components/Heading';
 
 // const IndexPageHeader = () => <Heading>Albert Gwo</Heading>;
 
@@ -16,6 +16,21 @@ export const fadeConfig = {
   precision: 0.001,
 };
 
+export const titleScaleConfig = {
+  mass: 6.5,
+  tension: 200,
+  friction: 140,
+  clamp: true,
+  precision: 0.001,
+};
+
+export const fadeTransition = {
+  from: { opacity: 0 },
+  enter: { opacity: 1 },
+  leave: { opacity: 0 },
+  config: fadeConfig,
+};
+
 export function useFadeAnimations(
   onFadeOutAnimComplete?: () => void,
   onInitialAnimComplete?: () => void